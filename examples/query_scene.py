@@ -33,8 +33,9 @@ async def main():
     client = GamaltaClient()
     responses = []
     
-    def capture_response(data: bytes):
+    def capture_response(data: bytes | memoryview):
         """Capture all responses for analysis."""
+        data = bytes(data)
         responses.append(data)
         hex_str = data.hex(" ")
         print(f"  RX: {hex_str}")
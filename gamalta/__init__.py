@@ -11,7 +11,7 @@ Example:
 """
 
 from .client import GamaltaClient
-from .types import Color, LightningConfig, Mode, Day
+from .types import Color, LightningConfig, Mode, Day, DeviceState
 from .exceptions import (
     GamaltaError,
     ConnectionError,
@@ -20,7 +20,7 @@ from .exceptions import (
     CommandError,
     NotConnectedError,
 )
-from .transport.ble import scan_for_devices, find_device
+from .transport.ble import scan_for_devices, find_device, stop_scanner
 from .scenes import (
     Scene,
     SceneKeyframe,
@@ -40,6 +40,7 @@ __all__ = [
     "LightningConfig", 
     "Mode",
     "Day",
+    "DeviceState",
     # Scenes
     "Scene",
     "SceneKeyframe",
@@ -57,4 +58,5 @@ __all__ = [
     # Discovery
     "scan_for_devices",
     "find_device",
+    "stop_scanner",
 ]
@@ -8,12 +8,14 @@ import asyncio
 from datetime import datetime
 from typing import Callable, Awaitable
 
-from .types import Color, LightningConfig, Mode
+from bleak.backends.device import BLEDevice
+
+from .types import Color, DeviceState, LightningConfig, Mode
 from .exceptions import NotConnectedError
 from .protocol.packet import PacketBuilder
 from .protocol import commands
 from .transport.base import Transport
-from .transport.ble import BleTransport, find_device
+from .transport.ble import BleTransport, find_device, stop_scanner
 from .scenes import get_scene
 
 
@@ -45,7 +47,7 @@ class GamaltaClient:
         self._transport = transport or BleTransport()
         self._packet_builder = PacketBuilder()
         self._connected = False
-        self._notify_callback: Callable[[bytes], None] | None = None
+        self._notify_callback: Callable[[bytes | memoryview], None] | None = None
     
     @property
     def is_connected(self) -> bool:
@@ -54,7 +56,7 @@ class GamaltaClient:
     
     async def connect(
         self,
-        address: str | None = None,
+        address: BLEDevice | str | None = None,
         name_filter: str = "Gamalta",
         timeout: float = 5.0
     ) -> None:
@@ -64,7 +66,7 @@ class GamaltaClient:
         If no address is provided, scans for devices matching the name filter.
         
         Args:
-            address: Specific device address, or None to auto-discover
+            address: Specific device (BLEDevice or address), or None to auto-discover
             name_filter: Name filter for auto-discovery
             timeout: Scan timeout in seconds
             
@@ -72,10 +74,10 @@ class GamaltaClient:
             DeviceNotFoundError: If no device found during auto-discovery
             ConnectionError: If connection fails
         """
-        # Auto-discover if no address provided
+        # Auto-discover if no address provided; connect with the discovered
+        # device itself so the transport can skip re-resolving the address
         if address is None:
-            device = await find_device(name_filter, timeout)
-            address = device.address
+            address = await find_device(name_filter, timeout)
         
         # Connect transport
         await self._transport.connect(address)
@@ -89,9 +91,15 @@ class GamaltaClient:
         self._connected = True
     
     async def disconnect(self) -> None:
-        """Disconnect from the device."""
+        """
+        Disconnect from the device.
+        
+        Also stops a background scanner left running with
+        ``scan_for_devices(keep_scanning=True)``.
+        """
         self._connected = False
         await self._transport.disconnect()
+        await stop_scanner()
     
     async def _send(self, payload: bytes) -> None:
         """Send a command payload (header and sequence added automatically)."""
@@ -121,18 +129,21 @@ class GamaltaClient:
         await self._send(commands.build_timer_query(1))
         await self._send(commands.build_timer_query(2))
     
-    def _on_notify(self, data: bytes) -> None:
+    def _on_notify(self, data: bytes | memoryview) -> None:
         """Handle notification data from device."""
         if self._notify_callback:
             self._notify_callback(data)
     
     def on_notify(
         self, 
-        callback: Callable[[bytes], None] | None
+        callback: Callable[[bytes | memoryview], None] | None
     ) -> None:
         """
         Set a callback for device notifications.
         
+        The data may be a memoryview that is only valid for the duration of
+        the callback; call bytes() on it to keep a copy.
+        
         Args:
             callback: Function to call with notification data, or None to clear
         """
@@ -377,7 +388,35 @@ class GamaltaClient:
     # State Query
     # =========================================================================
     
-    async def query_state(self, timeout: float = 2.0) -> dict:
+    @staticmethod
+    def parse_state(data: bytes | memoryview) -> DeviceState | None:
+        """
+        Parse a state response notification.
+        
+        Args:
+            data: Raw notification data
+            
+        Returns:
+            State in the same format as query_state, or None if the
+            data is not a complete state response
+        """
+        # [A5] [seq] [04] [08] [power] [mode] [bright] [R] [G] [B] [C] [W]
+        if len(data) < 12 or data[2] != 0x04:
+            return None
+        return {
+            "power": data[4] == 0x01,
+            "mode": data[5],
+            "brightness": data[6],
+            "color": Color(
+                r=data[7],
+                g=data[8],
+                b=data[9],
+                warm_white=data[11],  # W comes after C
+                cool_white=data[10],
+            ),
+        }
+    
+    async def query_state(self, timeout: float = 2.0) -> DeviceState:
         """
         Query the current device state.
         
@@ -395,14 +434,15 @@ class GamaltaClient:
             Color values are LIVE INTERPOLATED for 24h scenes,
             not the static scene definition.
         """
-        response_data: bytes | None = None
+        state: DeviceState | None = None
         response_event = asyncio.Event()
         
-        def capture_response(data: bytes) -> None:
-            nonlocal response_data
+        def capture_response(data: bytes | memoryview) -> None:
+            nonlocal state
             # Response starts with A5, then seq, then 0x04 (state response)
             if len(data) >= 3 and data[2] == 0x04:
-                response_data = data
+                # Parse straight from the notification buffer instead of copying it
+                state = self.parse_state(data)
                 response_event.set()
         
         # Temporarily capture the response
@@ -413,20 +453,8 @@ class GamaltaClient:
             await self._send(commands.build_state_query())
             await asyncio.wait_for(response_event.wait(), timeout=timeout)
             
-            if response_data and len(response_data) >= 12:
-                # Parse: [A5] [seq] [04] [08] [power] [mode] [bright] [R] [G] [B] [C] [W]
-                return {
-                    "power": response_data[4] == 0x01,
-                    "mode": response_data[5],
-                    "brightness": response_data[6],
-                    "color": Color(
-                        r=response_data[7],
-                        g=response_data[8],
-                        b=response_data[9],
-                        warm_white=response_data[11],  # W comes after C
-                        cool_white=response_data[10],
-                    ),
-                }
+            if state is not None:
+                return state
             else:
                 return {"power": False, "mode": 0, "brightness": 0, "color": Color.off()}
         except asyncio.TimeoutError:
@@ -448,14 +476,17 @@ class GamaltaClient:
         Returns:
             Device name as a string
         """
-        response_data: bytes | None = None
+        name_bytes: bytes | None = None
         response_event = asyncio.Event()
         
-        def capture_response(data: bytes) -> None:
-            nonlocal response_data
+        def capture_response(data: bytes | memoryview) -> None:
+            nonlocal name_bytes
             # Response starts with A5, then seq, then 0x43 (name response)
             if len(data) >= 3 and data[2] == 0x43:
-                response_data = data
+                # Parse: [A5] [seq] [43] [10] [name as ASCII, null-padded]
+                # Only the name itself is copied out of the notification buffer
+                if len(data) >= 4:
+                    name_bytes = bytes(data[4:])
                 response_event.set()
         
         # Temporarily capture the response
@@ -466,9 +497,7 @@ class GamaltaClient:
             await self._send(commands.build_name_query())
             await asyncio.wait_for(response_event.wait(), timeout=timeout)
             
-            if response_data and len(response_data) >= 4:
-                # Parse: [A5] [seq] [43] [10] [name as ASCII, null-padded]
-                name_bytes = response_data[4:]
+            if name_bytes is not None:
                 # Strip null padding and decode
                 name = name_bytes.rstrip(b'\x00').decode('ascii', errors='replace')
                 return name
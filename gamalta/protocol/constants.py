@@ -4,17 +4,22 @@ Gamalta Protocol Constants
 BLE UUIDs, command opcodes, and mode identifiers for the Gamalta smart light protocol.
 """
 
+import sys
+
 # =============================================================================
 # BLE Service & Characteristic UUIDs
 # =============================================================================
+# Stored in bleak's normalized form (lowercase 128-bit). They are interned,
+# but bleak normalizes string specifiers into a new string on each call, so
+# this does not speed up its characteristic lookups.
 
-SERVICE_UUID = "0000fff0-0000-1000-8000-00805f9b34fb"
+SERVICE_UUID = sys.intern("0000fff0-0000-1000-8000-00805f9b34fb")
 """Main BLE UART-like service UUID"""
 
-CHAR_WRITE_UUID = "0000fff3-0000-1000-8000-00805f9b34fb"
+CHAR_WRITE_UUID = sys.intern("0000fff3-0000-1000-8000-00805f9b34fb")
 """Write characteristic for sending commands (Write Without Response)"""
 
-CHAR_NOTIFY_UUID = "0000fff4-0000-1000-8000-00805f9b34fb"
+CHAR_NOTIFY_UUID = sys.intern("0000fff4-0000-1000-8000-00805f9b34fb")
 """Notify characteristic for receiving responses"""
 
 # =============================================================================
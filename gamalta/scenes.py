@@ -9,6 +9,7 @@ The interpolation matches the official app's behavior by calculating the current
 color and brightness based on the time of day and applying it before mode switches.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from typing import Dict, List, Optional
@@ -55,6 +56,11 @@ class SceneKeyframe:
                 f"Bright={self.brightness}%)")
 
 
+def _keyframe_minutes(kf: SceneKeyframe) -> int:
+    """Sort/search key for keyframes."""
+    return kf.time_minutes
+
+
 @dataclass
 class Scene:
     """
@@ -66,10 +72,28 @@ class Scene:
     name: str
     mode_id: int
     keyframes: List[SceneKeyframe] = field(default_factory=list)
+    _sorted: bool = field(default=False, repr=False, compare=False)
     
     def __post_init__(self):
-        # Sort keyframes by time
-        self.keyframes = sorted(self.keyframes, key=lambda k: k.time_minutes)
+        # Sort keyframes by time unless the caller guarantees they already are
+        if self._sorted:
+            self.keyframes = list(self.keyframes)
+        else:
+            self.keyframes = sorted(self.keyframes, key=_keyframe_minutes)
+    
+    @classmethod
+    def from_sorted(
+        cls,
+        name: str,
+        mode_id: int,
+        keyframes: List[SceneKeyframe]
+    ) -> "Scene":
+        """
+        Create a scene from keyframes already ordered by time of day.
+        
+        Skips the sort done by the regular constructor.
+        """
+        return cls(name=name, mode_id=mode_id, keyframes=keyframes, _sorted=True)
     
     def get_interpolated_state(
         self, 
@@ -87,23 +111,35 @@ class Scene:
         if current_time is None:
             current_time = datetime.now()
         
+        return self.get_interpolated_state_by_minute(
+            current_time.hour * 60 + current_time.minute
+        )
+    
+    def get_interpolated_state_by_minute(
+        self,
+        minute_of_day: int
+    ) -> tuple[Color, int]:
+        """
+        Calculate the interpolated color and brightness for a minute of the day.
+        
+        Callers that already know the clock minute can use this directly and
+        skip building a datetime.
+        
+        Args:
+            minute_of_day: Minutes since midnight (0-1439)
+            
+        Returns:
+            Tuple of (Color, brightness_percent)
+        """
         if not self.keyframes:
             return Color.off(), 0
         
-        # Convert to minutes since midnight
-        now_minutes = current_time.hour * 60 + current_time.minute
-        
-        # Find surrounding keyframes
-        prev_kf = self.keyframes[-1]  # Wrap around from end of day
-        next_kf = self.keyframes[0]   # Wrap around to start of day
+        now_minutes = minute_of_day
         
-        for i, kf in enumerate(self.keyframes):
-            if kf.time_minutes <= now_minutes:
-                prev_kf = kf
-                next_kf = self.keyframes[(i + 1) % len(self.keyframes)]
-            else:
-                next_kf = kf
-                break
+        # Find surrounding keyframes (index 0 wraps around from end of day)
+        i = bisect_right(self.keyframes, now_minutes, key=_keyframe_minutes)
+        prev_kf = self.keyframes[i - 1]
+        next_kf = self.keyframes[i % len(self.keyframes)]
         
         # Handle wrap-around midnight
         prev_time = prev_kf.time_minutes
@@ -115,16 +151,16 @@ class Scene:
             if now_minutes < prev_time:
                 now_minutes += 24 * 60
         
-        # Calculate interpolation factor (0.0 to 1.0)
+        # Calculate interpolation factor as Q16 fixed-point (0 to 65536)
         if next_time == prev_time:
-            t = 0.0
+            t_q = 0
         else:
-            t = (now_minutes - prev_time) / (next_time - prev_time)
-            t = max(0.0, min(1.0, t))
+            t_q = (now_minutes - prev_time) * 65536 // (next_time - prev_time)
+            t_q = max(0, min(65536, t_q))
         
-        # Linear interpolation
+        # Linear interpolation in integer arithmetic (rounds half up)
         def lerp(a: int, b: int) -> int:
-            return int(round(a + (b - a) * t))
+            return (a * 65536 + (b - a) * t_q + 32768) >> 16
         
         color = Color(
             r=lerp(prev_kf.r, next_kf.r),
@@ -183,7 +219,7 @@ class SceneRegistry:
     def _register_builtin_scenes(self):
         """Register built-in scene definitions."""
         # Fish Blue (0x03)
-        self.register(Scene(
+        self.register(Scene.from_sorted(
             name="Fish Blue",
             mode_id=0x03,
             keyframes=FISH_BLUE_KEYFRAMES,
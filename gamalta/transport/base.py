@@ -1,16 +1,19 @@
 """
-Abstract Transport Interface
+Transport Interface
 
 Defines the interface for BLE (and potentially other) transports.
 """
 
-from abc import ABC, abstractmethod
-from typing import Callable, Awaitable
+from typing import Any, Callable, Awaitable, Protocol, runtime_checkable
 
 
-class Transport(ABC):
+@runtime_checkable
+class Transport(Protocol):
     """
-    Abstract base class for device communication transports.
+    Structural interface for device communication transports.
+    
+    Implementations only need to provide these members; subclassing is
+    optional and carries no ABC metaclass overhead.
     
     This abstraction allows for:
     - Mock transport for unit testing
@@ -18,25 +21,23 @@ class Transport(ABC):
     """
     
     @property
-    @abstractmethod
     def is_connected(self) -> bool:
         """Check if transport is currently connected."""
         ...
     
-    @abstractmethod
-    async def connect(self, address: str) -> None:
+    async def connect(self, address: Any) -> None:
         """
         Establish connection to a device.
         
         Args:
-            address: Device address (format depends on transport type)
+            address: Device address, or a transport-specific device object
+                (format depends on transport type)
             
         Raises:
             ConnectionError: If connection fails
         """
         ...
     
-    @abstractmethod
     async def disconnect(self) -> None:
         """
         Close the connection.
@@ -45,7 +46,6 @@ class Transport(ABC):
         """
         ...
     
-    @abstractmethod
     async def write(self, data: bytes) -> None:
         """
         Write data to the device.
@@ -59,14 +59,19 @@ class Transport(ABC):
         """
         ...
     
-    @abstractmethod
     async def subscribe(
         self, 
-        callback: Callable[[bytes], None] | Callable[[bytes], Awaitable[None]] | None
+        callback: Callable[[bytes | memoryview], None]
+        | Callable[[bytes | memoryview], Awaitable[None]]
+        | None
     ) -> None:
         """
         Subscribe to notifications from the device.
         
+        Transports may hand callbacks a memoryview over their receive buffer
+        to avoid a copy per notification. Callbacks must not retain it past
+        return; call bytes() on it to keep the data.
+        
         Args:
             callback: Function to call with received data, or None to unsubscribe
         """
@@ -5,10 +5,12 @@ Bleak-based Bluetooth Low Energy transport for Gamalta devices.
 """
 
 import asyncio
-from typing import Callable, Awaitable
+import time
+from typing import Callable, Awaitable, Literal
 
 from bleak import BleakClient, BleakScanner
 from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
 from bleak.exc import BleakError
 
 from .base import Transport
@@ -16,37 +18,248 @@ from ..protocol.constants import CHAR_WRITE_UUID, CHAR_NOTIFY_UUID
 from ..exceptions import ConnectionError, DeviceNotFoundError, NotConnectedError, CommandError
 
 
+class _SharedScanner:
+    """
+    Process-wide BLE scanner shared by all discovery calls.
+    
+    Started lazily on first use and shared by overlapping scans. It stops
+    when the last one finishes, unless a caller asked to keep it running,
+    so repeated scans read from the advertisement cache instead of
+    re-registering a scanner with the OS Bluetooth stack each time. The
+    scanner belongs to the event loop that started it; a scan from a
+    different loop (e.g. a second ``asyncio.run()``) drops it and starts a
+    fresh one.
+    """
+    
+    # Advertisements older than this are dropped from the cache
+    MAX_DEVICE_AGE = 60.0
+    
+    _scanner: BleakScanner | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+    _lock: asyncio.Lock | None = None
+    _detected: asyncio.Event | None = None
+    _pruned_at: float = 0.0
+    _users: int = 0
+    _keep_alive: bool = False
+    started_at: float = 0.0
+    recent_devices: dict[str, tuple[BLEDevice, float]] = {}
+    
+    @classmethod
+    def _bind_loop(cls) -> asyncio.Lock:
+        """
+        Reset all loop-bound state if the running loop has changed.
+        
+        Returns:
+            The lock guarding the scanner on the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._loop is loop and cls._lock is not None:
+            return cls._lock
+        # A scanner from a previous loop cannot be stopped from this one
+        cls._scanner = None
+        cls._users = 0
+        cls._keep_alive = False
+        cls._loop = loop
+        cls._lock = lock = asyncio.Lock()
+        cls._detected = None
+        cls.recent_devices.clear()
+        return lock
+    
+    @classmethod
+    def _detection_event(cls) -> asyncio.Event:
+        """The event set by the next advertisement, created on first use."""
+        if cls._detected is None:
+            cls._detected = asyncio.Event()
+        return cls._detected
+    
+    @classmethod
+    def _prune(cls, now: float) -> None:
+        """Drop devices that have not advertised within MAX_DEVICE_AGE."""
+        cutoff = now - cls.MAX_DEVICE_AGE
+        cls.recent_devices = {
+            address: entry for address, entry in cls.recent_devices.items()
+            if entry[1] >= cutoff
+        }
+        cls._pruned_at = now
+    
+    @classmethod
+    def _on_detection(cls, device: BLEDevice, advertisement_data: AdvertisementData) -> None:
+        if not device.name:
+            return
+        now = time.monotonic()
+        cls.recent_devices[device.address] = (device, now)
+        if now - cls._pruned_at > cls.MAX_DEVICE_AGE:
+            cls._prune(now)
+        # Wake everyone waiting on this generation, then start a new one
+        detected, cls._detected = cls._detection_event(), asyncio.Event()
+        detected.set()
+    
+    @classmethod
+    async def acquire(
+        cls,
+        scanning_mode: Literal["active", "passive"] = "active",
+        adapter: str | None = None,
+        keep_alive: bool = False,
+    ) -> None:
+        """
+        Start the scanner if it is not already running and register a user.
+        
+        The scanning mode and adapter only apply to the call that starts it.
+        Every acquire must be paired with a release().
+        
+        Args:
+            keep_alive: Keep scanning after the last user releases it,
+                until stop() is called
+        """
+        async with cls._bind_loop():
+            cls._keep_alive = cls._keep_alive or keep_alive
+            if cls._scanner is None:
+                scanner = BleakScanner(
+                    detection_callback=cls._on_detection,
+                    scanning_mode=scanning_mode,
+                    adapter=adapter,
+                )
+                await scanner.start()
+                cls._scanner = scanner
+                cls.started_at = time.monotonic()
+            cls._users += 1
+    
+    @classmethod
+    async def release(cls) -> None:
+        """Unregister a user, stopping the scanner if it was the last one."""
+        async with cls._bind_loop():
+            cls._users = max(cls._users - 1, 0)
+            if cls._users == 0 and not cls._keep_alive:
+                await cls._stop_locked()
+    
+    @classmethod
+    async def stop(cls) -> None:
+        """
+        Stop the scanner, or let it stop once in-flight scans finish.
+        
+        Cached advertisements are kept until they age out, so a device found
+        by an earlier scan can still be connected to by address.
+        """
+        async with cls._bind_loop():
+            cls._keep_alive = False
+            if cls._users == 0:
+                await cls._stop_locked()
+    
+    @classmethod
+    async def _stop_locked(cls) -> None:
+        """Stop the running scanner; the caller holds the lock."""
+        if cls._scanner is None:
+            return
+        try:
+            await cls._scanner.stop()
+        except BleakError:
+            pass  # Ignore stop errors
+        finally:
+            cls._scanner = None
+    
+    @classmethod
+    def snapshot(cls, name_filter: str, max_age: float) -> list[BLEDevice]:
+        """Devices matching the filter that advertised within max_age seconds."""
+        now = time.monotonic()
+        cls._prune(now)
+        cutoff = now - max_age
+        return [
+            device for device, seen in cls.recent_devices.values()
+            if seen >= cutoff and name_filter in (device.name or "")
+        ]
+    
+    @classmethod
+    async def wait_for_detection(cls) -> None:
+        """Wait until the next advertisement is seen."""
+        await cls._detection_event().wait()
+
+
 async def scan_for_devices(
     name_filter: str = "Gamalta",
-    timeout: float = 5.0
+    timeout: float = 5.0,
+    min_count: int | None = None,
+    scanning_mode: Literal["active", "passive"] = "active",
+    adapter: str | None = None,
+    keep_scanning: bool = False,
 ) -> list[BLEDevice]:
     """
     Scan for Gamalta devices.
     
+    Overlapping calls share one scanner, which stops when the last of them
+    returns unless ``keep_scanning`` is set. Devices it has already seen
+    are returned immediately when they satisfy the request; otherwise this
+    waits for matches for up to ``timeout`` seconds.
+    
     Args:
         name_filter: String that must appear in device name
-        timeout: Scan duration in seconds
+        timeout: Maximum scan duration in seconds
+        min_count: Stop early once this many devices match (None scans
+            for the full timeout unless the scanner has already been
+            running that long and has seen a match)
+        scanning_mode: "active" or "passive" (passive is not supported
+            on every backend)
+        adapter: Bluetooth adapter to use (e.g. "hci0" on Linux)
+        keep_scanning: Leave the scanner running after this call so later
+            scans answer from its cache; stop it with stop_scanner()
         
     Returns:
         List of discovered BLE devices matching the filter
     """
-    devices = await BleakScanner.discover(timeout=timeout)
-    return [
-        d for d in devices 
-        if d.name and name_filter in d.name
-    ]
+    await _SharedScanner.acquire(scanning_mode, adapter, keep_scanning)
+    try:
+        deadline = time.monotonic() + timeout
+        # Once the scanner has run this long its cache covers a full scan
+        window_end = _SharedScanner.started_at + timeout
+        
+        while True:
+            devices = _SharedScanner.snapshot(name_filter, timeout)
+            now = time.monotonic()
+            if min_count is not None and len(devices) >= min_count:
+                return devices
+            if min_count is None and devices and now >= window_end:
+                return devices
+            
+            remaining = deadline - now
+            if remaining <= 0:
+                return devices
+            
+            try:
+                await asyncio.wait_for(_SharedScanner.wait_for_detection(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        await _SharedScanner.release()
+
+
+async def stop_scanner() -> None:
+    """
+    Stop a scanner kept running by ``scan_for_devices(keep_scanning=True)``.
+    
+    Scans still in progress finish first. The next scan starts it again.
+    Scans without ``keep_scanning`` stop the scanner on their own, so this
+    is only needed after opting in.
+    """
+    await _SharedScanner.stop()
 
 
 async def find_device(
     name_filter: str = "Gamalta",
-    timeout: float = 5.0
+    timeout: float = 5.0,
+    scanning_mode: Literal["active", "passive"] = "active",
+    adapter: str | None = None,
 ) -> BLEDevice:
     """
     Find a single Gamalta device.
     
+    Returns immediately if a matching device is already in the shared
+    scanner's cache, otherwise as soon as the first one advertises.
+    
     Args:
         name_filter: String that must appear in device name
-        timeout: Scan duration in seconds
+        timeout: Maximum scan duration in seconds
+        scanning_mode: "active" or "passive" (passive is not supported
+            on every backend)
+        adapter: Bluetooth adapter to use (e.g. "hci0" on Linux)
         
     Returns:
         First matching BLE device
@@ -54,18 +267,21 @@ async def find_device(
     Raises:
         DeviceNotFoundError: If no matching device found
     """
-    device = await BleakScanner.find_device_by_filter(
-        lambda d, ad: d.name is not None and name_filter in d.name,
-        timeout=timeout
+    devices = await scan_for_devices(
+        name_filter,
+        timeout,
+        min_count=1,
+        scanning_mode=scanning_mode,
+        adapter=adapter,
     )
     
-    if device is None:
+    if not devices:
         raise DeviceNotFoundError(
             f"No device found matching '{name_filter}'. "
             "Ensure the light is powered on and not connected to another app."
         )
     
-    return device
+    return devices[0]
 
 
 class BleTransport(Transport):
@@ -75,10 +291,26 @@ class BleTransport(Transport):
     This is the primary transport for communicating with Gamalta devices.
     """
     
-    def __init__(self):
+    # Maximum notifications buffered while the callback is busy
+    NOTIFY_QUEUE_SIZE = 256
+    
+    def __init__(self, resolve_timeout: float = 10.0):
+        """
+        Initialize the transport.
+        
+        Args:
+            resolve_timeout: Seconds to scan for a device connected to by
+                address when it is not in the scanner cache (bleak's own
+                connect timeout is 10 s)
+        """
+        self._resolve_timeout = resolve_timeout
         self._client: BleakClient | None = None
         self._address: str | None = None
-        self._notify_callback: Callable[[bytes], None] | None = None
+        self._device: BLEDevice | None = None
+        self._first_write_done = False
+        self._notify_callback: Callable[[bytes | memoryview], None] | None = None
+        self._queue: asyncio.Queue[memoryview] = asyncio.Queue(maxsize=self.NOTIFY_QUEUE_SIZE)
+        self._consumer: asyncio.Task[None] | None = None
     
     @property
     def is_connected(self) -> bool:
@@ -90,30 +322,69 @@ class BleTransport(Transport):
         """The address of the connected device, or None if not connected."""
         return self._address
     
-    async def connect(self, address: str) -> None:
+    async def _resolve_device(self, address: str) -> BLEDevice:
+        """
+        Look up the BLEDevice for an address.
+        
+        Prefers the shared scanner's cache and only falls back to a
+        targeted scan on a miss.
+        
+        Raises:
+            DeviceNotFoundError: If the device is not advertising
+            ConnectionError: If the scan itself fails
         """
-        Connect to a device by address.
+        cached = _SharedScanner.recent_devices.get(address)
+        if cached is not None:
+            return cached[0]
+        
+        try:
+            device = await BleakScanner.find_device_by_address(
+                address, timeout=self._resolve_timeout
+            )
+        except BleakError as e:
+            raise ConnectionError(f"Failed to connect to {address}: {e}") from e
+        if device is None:
+            raise DeviceNotFoundError(f"Device {address} not found")
+        return device
+    
+    async def connect(self, target: BLEDevice | str) -> None:
+        """
+        Connect to a device.
+        
+        Passing a BLEDevice (e.g. from scan_for_devices) connects directly.
+        An address string is resolved through the scanner cache first, so
+        bleak does not have to run its own discovery pass before connecting.
         
         Args:
-            address: BLE device address (MAC on Linux, UUID on macOS)
+            target: BLEDevice, or BLE device address (MAC on Linux, UUID on macOS)
             
         Raises:
+            DeviceNotFoundError: If an address cannot be resolved to a device
             ConnectionError: If connection fails
         """
         if self.is_connected:
             await self.disconnect()
         
+        if isinstance(target, BLEDevice):
+            device = target
+        else:
+            device = await self._resolve_device(target)
+        
         try:
-            self._client = BleakClient(address)
+            self._client = BleakClient(device)
+            self._first_write_done = False
             await self._client.connect()
-            self._address = address
+            self._device = device
+            self._address = device.address
         except BleakError as e:
             self._client = None
+            self._device = None
             self._address = None
-            raise ConnectionError(f"Failed to connect to {address}: {e}") from e
+            raise ConnectionError(f"Failed to connect to {device.address}: {e}") from e
     
     async def disconnect(self) -> None:
         """Disconnect from the device."""
+        self._stop_consumer()
         if self._client is not None:
             try:
                 if self._client.is_connected:
@@ -122,6 +393,7 @@ class BleTransport(Transport):
                 pass  # Ignore disconnect errors
             finally:
                 self._client = None
+                self._device = None
                 self._address = None
     
     async def write(self, data: bytes) -> None:
@@ -138,22 +410,38 @@ class BleTransport(Transport):
         if not self.is_connected or self._client is None:
             raise NotConnectedError("Not connected to device")
         
+        # The first write after connecting is acknowledged (when the
+        # characteristic allows it) so ATT-level problems surface
+        # immediately instead of as a silently dropped command; later writes
+        # go without response. The Gamalta write characteristic is
+        # write-without-response only, so for it this never acknowledges.
+        response = False
+        if not self._first_write_done:
+            char = self._client.services.get_characteristic(CHAR_WRITE_UUID)
+            response = char is not None and "write" in char.properties
+        
         try:
             await self._client.write_gatt_char(
                 CHAR_WRITE_UUID, 
                 data, 
-                response=False
+                response=response
             )
+            self._first_write_done = True
         except BleakError as e:
             raise CommandError(f"Write failed: {e}") from e
     
     async def subscribe(
         self,
-        callback: Callable[[bytes], None] | Callable[[bytes], Awaitable[None]] | None
+        callback: Callable[[bytes | memoryview], None]
+        | Callable[[bytes | memoryview], Awaitable[None]]
+        | None
     ) -> None:
         """
         Subscribe to notifications from the device.
         
+        The callback receives a memoryview over bleak's notification buffer
+        rather than a copy.
+        
         Args:
             callback: Function to call with received data, or None to unsubscribe
             
@@ -170,17 +458,50 @@ class BleTransport(Transport):
             except BleakError:
                 pass
             self._notify_callback = None
+            self._stop_consumer()
         else:
-            # Subscribe with wrapper to handle the bleak callback signature
+            # Bleak's callback only enqueues; a single consumer task runs the
+            # user callback so coroutine callbacks don't need a task each
             def _wrapper(sender: int, data: bytearray):
-                if self._notify_callback:
-                    result = self._notify_callback(bytes(data))
-                    if asyncio.iscoroutine(result):
-                        asyncio.create_task(result)
+                # Bleak hands over a fresh bytearray per notification, so a
+                # view over it stays valid while queued - no bytes() copy
+                view = memoryview(data)
+                try:
+                    self._queue.put_nowait(view)
+                except asyncio.QueueFull:
+                    # Consumer is behind: drop the oldest notification
+                    self._queue.get_nowait()
+                    self._queue.put_nowait(view)
             
             self._notify_callback = callback
+            if self._consumer is None or self._consumer.done():
+                self._queue = asyncio.Queue(maxsize=self.NOTIFY_QUEUE_SIZE)
+                self._consumer = asyncio.create_task(self._drain())
             await self._client.start_notify(CHAR_NOTIFY_UUID, _wrapper)
     
+    async def _drain(self) -> None:
+        """Deliver queued notifications to the subscribed callback."""
+        while True:
+            data = await self._queue.get()
+            callback = self._notify_callback
+            if callback is None:
+                continue
+            try:
+                result = callback(data)
+                if asyncio.iscoroutine(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # A failing callback must not stop delivery of later notifications
+                continue
+    
+    def _stop_consumer(self) -> None:
+        """Cancel the notification consumer task."""
+        if self._consumer is not None:
+            self._consumer.cancel()
+            self._consumer = None
+    
     async def __aenter__(self) -> "BleTransport":
         """Context manager entry."""
         return self
@@ -7,6 +7,7 @@ Type-safe data classes for protocol parameters.
 from dataclasses import dataclass, field
 from datetime import time
 from enum import IntEnum
+from typing import ClassVar, TypedDict
 
 
 class Mode(IntEnum):
@@ -49,13 +50,26 @@ class Color:
     warm_white: int = 0
     cool_white: int = 0
     
+    # Shared preset instances (assigned below the class; safe since Color is frozen)
+    RED: ClassVar["Color"]
+    GREEN: ClassVar["Color"]
+    BLUE: ClassVar["Color"]
+    WHITE: ClassVar["Color"]
+    OFF: ClassVar["Color"]
+    
     def __post_init__(self):
-        for name, value in [
-            ('r', self.r), ('g', self.g), ('b', self.b),
-            ('warm_white', self.warm_white), ('cool_white', self.cool_white)
-        ]:
-            if not 0 <= value <= 255:
-                raise ValueError(f"{name} must be 0-255, got {value}")
+        # Any bit outside 0xFF (including the sign bits of a negative value)
+        # means some channel is out of range; only then find out which one
+        try:
+            out_of_range = (self.r | self.g | self.b | self.warm_white | self.cool_white) & ~0xFF
+        except TypeError:
+            # A non-int channel (e.g. a float); compare each one instead
+            out_of_range = True
+        if out_of_range:
+            for name in ('r', 'g', 'b', 'warm_white', 'cool_white'):
+                value = getattr(self, name)
+                if not 0 <= value <= 255:
+                    raise ValueError(f"{name} must be 0-255, got {value}")
     
     @classmethod
     def from_rgb(cls, r: int, g: int, b: int) -> "Color":
@@ -65,24 +79,33 @@ class Color:
     @classmethod
     def white(cls, warm: int = 0, cool: int = 255) -> "Color":
         """Create a white color using the white LED channels."""
+        if warm == 0 and cool == 255:
+            return cls.WHITE
         return cls(0, 0, 0, warm, cool)
     
     # Common preset colors
     @classmethod
     def red(cls) -> "Color":
-        return cls(255, 0, 0)
+        return cls.RED
     
     @classmethod
     def green(cls) -> "Color":
-        return cls(0, 255, 0)
+        return cls.GREEN
     
     @classmethod
     def blue(cls) -> "Color":
-        return cls(0, 0, 255)
+        return cls.BLUE
     
     @classmethod
     def off(cls) -> "Color":
-        return cls(0, 0, 0, 0, 0)
+        return cls.OFF
+
+
+Color.RED = Color(255, 0, 0)
+Color.GREEN = Color(0, 255, 0)
+Color.BLUE = Color(0, 0, 255)
+Color.WHITE = Color(0, 0, 0, 0, 255)
+Color.OFF = Color(0, 0, 0, 0, 0)
 
 
 @dataclass(frozen=True, slots=True)
@@ -104,6 +127,7 @@ class LightningConfig:
     end_time: time
     days: int = 0x7F  # All days by default
     enabled: bool = True
+    _days_byte: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not 0 <= self.intensity <= 100:
@@ -112,13 +136,15 @@ class LightningConfig:
             raise ValueError(f"frequency must be 0-10, got {self.frequency}")
         if not 0 <= self.days <= 0x7F:
             raise ValueError(f"days bitmask must be 0-127, got {self.days}")
+        # Frozen, so the encoded byte can be computed once
+        object.__setattr__(
+            self, '_days_byte', (self.days | 0x80) if self.enabled else self.days
+        )
     
     @property
     def days_byte(self) -> int:
         """Get the full days byte including enable bit."""
-        if self.enabled:
-            return self.days | 0x80
-        return self.days
+        return self._days_byte
     
     @classmethod
     def preview(cls) -> "LightningConfig":
@@ -135,3 +161,19 @@ class LightningConfig:
             days=0,
             enabled=False
         )
+
+
+class DeviceState(TypedDict):
+    """
+    Device state as reported by a state query.
+    
+    Attributes:
+        power: True when the light is on
+        mode: Mode ID
+        brightness: Brightness 0-100
+        color: Current RGBWC values
+    """
+    power: bool
+    mode: int
+    brightness: int
+    color: Color
@@ -10,7 +10,10 @@ class Settings(BaseSettings):
     port: int = 8080
     cors_origins: list[str] = ["http://localhost:5173", "http://127.0.0.1:5173"]
     poll_interval: float = 5.0
+    poll_max_interval: float = 60.0
     command_timeout: float = 5.0
+    settle_timeout: float = 0.3
+    batch_window: float = 0.02
 
     class Config:
         env_prefix = "GAMALTA_"
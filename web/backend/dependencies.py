@@ -1,8 +1,35 @@
 """FastAPI dependency injection for the Gamalta web backend."""
 
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends, HTTPException
+
 from .services.device_manager import device_manager, DeviceManager
 
 
+@lru_cache(maxsize=1)
 def get_device_manager() -> DeviceManager:
     """Get the global DeviceManager singleton."""
     return device_manager
+
+
+DeviceManagerDep = Annotated[DeviceManager, Depends(get_device_manager)]
+"""Endpoint parameter type that injects the DeviceManager singleton."""
+
+
+# Shared rejection for requests made while disconnected
+_NOT_CONNECTED_EXC = HTTPException(status_code=400, detail="Not connected to device")
+
+
+def not_connected() -> HTTPException:
+    """
+    Get the shared 400 error for requests made while disconnected.
+
+    Raising an exception stores the current traceback and, inside an except
+    block, the exception being handled as __context__. Both are cleared here
+    first, so the shared instance only keeps the most recent raise alive.
+    """
+    _NOT_CONNECTED_EXC.__traceback__ = None
+    _NOT_CONNECTED_EXC.__context__ = None
+    return _NOT_CONNECTED_EXC
@@ -8,11 +8,16 @@ Or from the web directory:
     python -m backend.main
 """
 
+import sys
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+
+from gamalta import stop_scanner
 
 from .config import settings
 from .routers import device, control, modes, effects
@@ -23,10 +28,17 @@ from .services.device_manager import device_manager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    # Startup
+    # Startup - build the OpenAPI schema now rather than on the first /docs hit
+    app.openapi()
     yield
-    # Shutdown - disconnect cleanly
+    # Shutdown - disconnect cleanly and release the BLE scanner
     await device_manager.disconnect()
+    await stop_scanner()
+
+
+def _route_operation_id(route: APIRoute) -> str:
+    """Use the endpoint function name as the OpenAPI operation ID."""
+    return route.name
 
 
 app = FastAPI(
@@ -34,6 +46,8 @@ app = FastAPI(
     description="REST and WebSocket API for controlling Gamalta BLE aquarium lights",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    generate_unique_id_function=_route_operation_id,
 )
 
 # CORS middleware for frontend development
@@ -55,15 +69,19 @@ app.include_router(effects.router, prefix="/api/effects", tags=["effects"])
 app.add_api_websocket_route("/ws", websocket_endpoint)
 
 
+# Static API info, serialized once
+_ROOT_JSON = ORJSONResponse({
+    "name": "Gamalta Web API",
+    "version": "0.1.0",
+    "docs": "/docs",
+    "websocket": "/ws",
+}).body
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API info."""
-    return {
-        "name": "Gamalta Web API",
-        "version": "0.1.0",
-        "docs": "/docs",
-        "websocket": "/ws",
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/health")
@@ -83,6 +101,9 @@ def run():
         host=settings.host,
         port=settings.port,
         reload=True,
+        # uvloop is not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
 
 
@@ -1,52 +1,58 @@
 """Pydantic models for API requests and responses."""
 
-from pydantic import BaseModel, Field
+from typing import Annotated
 
+from pydantic import BaseModel, ConfigDict, Field
 
-# Request models
 
-class ConnectRequest(BaseModel):
-    """Request to connect to a device."""
-    address: str | None = Field(default=None, description="BLE address (auto-discover if not provided)")
+# Reusable constrained types (constraints are compiled into the core schema once)
 
+Channel = Annotated[int, Field(ge=0, le=255)]
+Percent = Annotated[int, Field(ge=0, le=100)]
+Hour = Annotated[int, Field(ge=0, le=23)]
+Minute = Annotated[int, Field(ge=0, le=59)]
+FlashCount = Annotated[int, Field(ge=0, le=10)]
 
-class PowerRequest(BaseModel):
-    """Request to set power state."""
-    on: bool = Field(description="True to turn on, False to turn off")
 
+# Request models
 
-class ColorRequest(BaseModel):
-    """Request to set color."""
-    r: int = Field(ge=0, le=255, description="Red channel (0-255)")
-    g: int = Field(ge=0, le=255, description="Green channel (0-255)")
-    b: int = Field(ge=0, le=255, description="Blue channel (0-255)")
-    warm_white: int = Field(default=0, ge=0, le=255, description="Warm white channel (0-255)")
-    cool_white: int = Field(default=0, ge=0, le=255, description="Cool white channel (0-255)")
+class RequestModel(BaseModel):
+    """Base for request bodies: immutable, no unknown fields, no default revalidation."""
+    model_config = ConfigDict(extra="forbid", validate_default=False, frozen=True)
 
 
-class BrightnessRequest(BaseModel):
-    """Request to set brightness."""
-    percent: int = Field(ge=0, le=100, description="Brightness (0-100)")
+class ConnectRequest(RequestModel):
+    """Request to connect to a device."""
+    address: str | None = Field(default=None, description="BLE address (auto-discover if not provided)")
+
+
+class ColorRequest(RequestModel):
+    """Request to set color."""
+    r: Channel = Field(description="Red channel (0-255)")
+    g: Channel = Field(description="Green channel (0-255)")
+    b: Channel = Field(description="Blue channel (0-255)")
+    warm_white: Channel = Field(default=0, description="Warm white channel (0-255)")
+    cool_white: Channel = Field(default=0, description="Cool white channel (0-255)")
 
 
-class ModeRequest(BaseModel):
+class ModeRequest(RequestModel):
     """Request to set mode."""
     mode: str = Field(description="Mode name: MANUAL, SUNSYNC, CORAL_REEF, FISH_BLUE, WATERWEED")
 
 
-class LightningRequest(BaseModel):
+class LightningRequest(RequestModel):
     """Request to configure lightning effect."""
-    intensity: int = Field(ge=0, le=100, description="Flash intensity (0-100)")
-    frequency: int = Field(ge=0, le=10, description="Flashes per interval (0-10)")
-    start_hour: int = Field(ge=0, le=23, description="Start hour")
-    start_minute: int = Field(ge=0, le=59, description="Start minute")
-    end_hour: int = Field(ge=0, le=23, description="End hour")
-    end_minute: int = Field(ge=0, le=59, description="End minute")
+    intensity: Percent = Field(description="Flash intensity (0-100)")
+    frequency: FlashCount = Field(description="Flashes per interval (0-10)")
+    start_hour: Hour = Field(description="Start hour")
+    start_minute: Minute = Field(description="Start minute")
+    end_hour: Hour = Field(description="End hour")
+    end_minute: Minute = Field(description="End minute")
     days: list[str] = Field(description="Days: monday, tuesday, wednesday, thursday, friday, saturday, sunday")
     enabled: bool = Field(default=True, description="Enable lightning schedule")
 
 
-class NameRequest(BaseModel):
+class NameRequest(RequestModel):
     """Request to set device name."""
     name: str = Field(min_length=1, max_length=16, description="Device name (1-16 characters)")
 
@@ -1,15 +1,15 @@
 """Light control API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Annotated
+
+from fastapi import APIRouter, Body, HTTPException
 
 from gamalta.exceptions import GamaltaError, NotConnectedError
 
-from ..dependencies import get_device_manager
+from ..dependencies import DeviceManagerDep, not_connected
 from ..services.device_manager import DeviceManager
 from ..models import (
-    PowerRequest,
     ColorRequest,
-    BrightnessRequest,
     SuccessResponse,
 )
 
@@ -19,24 +19,24 @@ router = APIRouter()
 def _check_connected(manager: DeviceManager):
     """Check if connected to device."""
     if not manager.is_connected:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
 
 
 @router.post("/power", response_model=SuccessResponse)
 async def set_power(
-    request: PowerRequest,
-    manager: DeviceManager = Depends(get_device_manager),
+    on: Annotated[bool, Body(embed=True, description="True to turn on, False to turn off")],
+    manager: DeviceManagerDep,
 ):
     """Turn the light on or off."""
     _check_connected(manager)
     try:
-        if request.on:
+        if on:
             await manager.power_on()
         else:
             await manager.power_off()
         return SuccessResponse()
     except NotConnectedError:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     except GamaltaError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -44,7 +44,7 @@ async def set_power(
 @router.post("/color", response_model=SuccessResponse)
 async def set_color(
     request: ColorRequest,
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Set the light color (RGBWC)."""
     _check_connected(manager)
@@ -58,22 +58,22 @@ async def set_color(
         )
         return SuccessResponse()
     except NotConnectedError:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     except GamaltaError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/brightness", response_model=SuccessResponse)
 async def set_brightness(
-    request: BrightnessRequest,
-    manager: DeviceManager = Depends(get_device_manager),
+    percent: Annotated[int, Body(embed=True, ge=0, le=100, description="Brightness (0-100)")],
+    manager: DeviceManagerDep,
 ):
     """Set the brightness level."""
     _check_connected(manager)
     try:
-        await manager.set_brightness(request.percent)
+        await manager.set_brightness(percent)
         return SuccessResponse()
     except NotConnectedError:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     except GamaltaError as e:
         raise HTTPException(status_code=500, detail=str(e))
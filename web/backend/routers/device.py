@@ -1,11 +1,10 @@
 """Device management API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 
 from gamalta.exceptions import DeviceNotFoundError, GamaltaError
 
-from ..dependencies import get_device_manager
-from ..services.device_manager import DeviceManager
+from ..dependencies import DeviceManagerDep, not_connected
 from ..models import (
     ConnectRequest,
     ConnectResponse,
@@ -22,8 +21,8 @@ router = APIRouter()
 
 @router.get("/scan", response_model=ScanResponse)
 async def scan_devices(
+    manager: DeviceManagerDep,
     timeout: float = 5.0,
-    manager: DeviceManager = Depends(get_device_manager),
 ):
     """Scan for Gamalta devices."""
     try:
@@ -40,7 +39,7 @@ async def scan_devices(
 @router.post("/connect", response_model=ConnectResponse)
 async def connect_device(
     request: ConnectRequest,
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Connect to a Gamalta device."""
     try:
@@ -54,7 +53,7 @@ async def connect_device(
 
 @router.post("/disconnect", response_model=SuccessResponse)
 async def disconnect_device(
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Disconnect from the current device."""
     await manager.disconnect()
@@ -63,7 +62,7 @@ async def disconnect_device(
 
 @router.get("/status", response_model=StatusResponse)
 async def get_status(
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Get connection and device status."""
     state = await manager.get_state()
@@ -77,22 +76,22 @@ async def get_status(
 
 @router.get("/name", response_model=NameResponse)
 async def get_name(
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Get the device name."""
     if not manager.is_connected:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     return NameResponse(name=manager.device_name or "Unknown")
 
 
 @router.put("/name", response_model=SuccessResponse)
 async def set_name(
     request: NameRequest,
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Set the device name."""
     if not manager.is_connected:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     try:
         await manager.set_name(request.name)
         return SuccessResponse()
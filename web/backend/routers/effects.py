@@ -1,14 +1,15 @@
 """Effects API endpoints (lightning)."""
 
 from datetime import time
+from functools import reduce
+from operator import or_
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 
 from gamalta.types import LightningConfig, Day
 from gamalta.exceptions import GamaltaError, NotConnectedError
 
-from ..dependencies import get_device_manager
-from ..services.device_manager import DeviceManager
+from ..dependencies import DeviceManagerDep, not_connected
 from ..models import (
     LightningRequest,
     SuccessResponse,
@@ -16,42 +17,42 @@ from ..models import (
 
 router = APIRouter()
 
-# Day name to Day enum mapping
-DAY_MAP = {
-    "monday": Day.MONDAY,
-    "tuesday": Day.TUESDAY,
-    "wednesday": Day.WEDNESDAY,
-    "thursday": Day.THURSDAY,
-    "friday": Day.FRIDAY,
-    "saturday": Day.SATURDAY,
-    "sunday": Day.SUNDAY,
+
+# Day name to bitmask value mapping (plain ints so OR-ing skips IntEnum.__or__)
+DAY_MAP: dict[str, int] = {
+    name: int(day) for name, day in (
+        ("monday", Day.MONDAY),
+        ("tuesday", Day.TUESDAY),
+        ("wednesday", Day.WEDNESDAY),
+        ("thursday", Day.THURSDAY),
+        ("friday", Day.FRIDAY),
+        ("saturday", Day.SATURDAY),
+        ("sunday", Day.SUNDAY),
+    )
 }
 
 
 def _parse_days(day_names: list[str]) -> int:
     """Convert list of day names to bitmask."""
-    bitmask = 0
-    for name in day_names:
-        name_lower = name.lower()
-        if name_lower not in DAY_MAP:
-            raise ValueError(f"Invalid day name: {name}")
-        bitmask |= DAY_MAP[name_lower]
-    return bitmask
+    try:
+        return reduce(or_, (DAY_MAP[name.lower()] for name in day_names), 0)
+    except KeyError as e:
+        raise ValueError(f"Invalid day name: {e.args[0]}") from None
 
 
 @router.post("/lightning/preview", response_model=SuccessResponse)
 async def preview_lightning(
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Trigger a single lightning flash preview."""
     if not manager.is_connected:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
 
     try:
         await manager.preview_lightning()
         return SuccessResponse()
     except NotConnectedError:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     except GamaltaError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -59,11 +60,11 @@ async def preview_lightning(
 @router.post("/lightning/configure", response_model=SuccessResponse)
 async def configure_lightning(
     request: LightningRequest,
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Configure the lightning effect schedule."""
     if not manager.is_connected:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
 
     try:
         days_bitmask = _parse_days(request.days)
@@ -83,6 +84,6 @@ async def configure_lightning(
         await manager.configure_lightning(config)
         return SuccessResponse()
     except NotConnectedError:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     except GamaltaError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,12 +1,12 @@
 """Mode control API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 
 from gamalta.types import Mode
 from gamalta.exceptions import GamaltaError, NotConnectedError
 
-from ..dependencies import get_device_manager
-from ..services.device_manager import DeviceManager
+from ..dependencies import DeviceManagerDep, not_connected
 from ..models import (
     ModeRequest,
     ModeInfo,
@@ -16,71 +16,79 @@ from ..models import (
 
 router = APIRouter()
 
+
 # Mode descriptions
 MODE_INFO = {
     Mode.MANUAL: ModeInfo(
-        id=Mode.MANUAL,
+        id=int(Mode.MANUAL),
         name="MANUAL",
         description="Static color mode - set your own color",
         has_schedule=False,
     ),
     Mode.SUNSYNC: ModeInfo(
-        id=Mode.SUNSYNC,
+        id=int(Mode.SUNSYNC),
         name="SUNSYNC",
         description="Intelligent 24-hour sun simulation cycle",
         has_schedule=True,
     ),
     Mode.CORAL_REEF: ModeInfo(
-        id=Mode.CORAL_REEF,
+        id=int(Mode.CORAL_REEF),
         name="CORAL_REEF",
         description="24-hour coral reef color cycle",
         has_schedule=True,
     ),
     Mode.FISH_BLUE: ModeInfo(
-        id=Mode.FISH_BLUE,
+        id=int(Mode.FISH_BLUE),
         name="FISH_BLUE",
         description="24-hour deep blue cycle for fish",
         has_schedule=True,
     ),
     Mode.WATERWEED: ModeInfo(
-        id=Mode.WATERWEED,
+        id=int(Mode.WATERWEED),
         name="WATERWEED",
         description="24-hour plant growth cycle",
         has_schedule=True,
     ),
 }
 
+# Mode name lookup, built once so parsing a request is a plain dict get
+_MODE_LOOKUP: dict[str, Mode] = {m.name: m for m in Mode}
+_VALID_MODES_STR = ", ".join(_MODE_LOOKUP)
+
+
+# The mode list never changes, so serialize it once at import time
+_MODES_JSON = ORJSONResponse(
+    ModesResponse(modes=list(MODE_INFO.values())).model_dump()
+).body
+
 
 @router.get("", response_model=ModesResponse)
 async def list_modes():
     """List available modes."""
-    return ModesResponse(modes=list(MODE_INFO.values()))
+    return Response(content=_MODES_JSON, media_type="application/json")
 
 
 @router.post("/set", response_model=SuccessResponse)
 async def set_mode(
     request: ModeRequest,
-    manager: DeviceManager = Depends(get_device_manager),
+    manager: DeviceManagerDep,
 ):
     """Set the operating mode."""
     if not manager.is_connected:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
 
     # Parse mode name to Mode enum
-    mode_name = request.mode.upper()
-    try:
-        mode = Mode[mode_name]
-    except KeyError:
-        valid_modes = ", ".join(m.name for m in Mode)
+    mode = _MODE_LOOKUP.get(request.mode.upper())
+    if mode is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid mode '{request.mode}'. Valid modes: {valid_modes}",
+            detail=f"Invalid mode '{request.mode}'. Valid modes: {_VALID_MODES_STR}",
         )
 
     try:
         await manager.set_mode(mode)
         return SuccessResponse()
     except NotConnectedError:
-        raise HTTPException(status_code=400, detail="Not connected to device")
+        raise not_connected()
     except GamaltaError as e:
         raise HTTPException(status_code=500, detail=str(e))
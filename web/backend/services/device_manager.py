@@ -5,13 +5,15 @@ Wraps GamaltaClient and provides thread-safe access with state broadcasting.
 """
 
 import asyncio
+import time
 from collections.abc import Callable, Awaitable
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from gamalta import GamaltaClient
 from gamalta.types import Mode, Color, LightningConfig
-from gamalta.exceptions import NotConnectedError
-from gamalta.transport.ble import scan_for_devices
+from gamalta.exceptions import CommandError, NotConnectedError
+from gamalta.transport.ble import scan_for_devices, stop_scanner
 
 from ..config import settings
 
@@ -19,6 +21,69 @@ from ..config import settings
 StateCallback = Callable[[dict], Awaitable[None]]
 
 
+@dataclass(slots=True)
+class Command:
+    """A GamaltaClient method call queued for execution."""
+    method: str
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+    expect: Callable[[dict], bool] | None = None
+
+
+@dataclass(slots=True)
+class StateRecord:
+    """Flat device state, compared to detect changes between ticks."""
+    power: bool
+    mode: int
+    brightness: int
+    r: int
+    g: int
+    b: int
+    warm_white: int
+    cool_white: int
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StateRecord":
+        """Build a record from a GamaltaClient state dict."""
+        color = state.get("color", Color.off())
+        return cls(
+            state.get("power", False),
+            state.get("mode", 0),
+            state.get("brightness", 0),
+            color.r,
+            color.g,
+            color.b,
+            color.warm_white,
+            color.cool_white,
+        )
+
+
+# Consecutive failed deliveries before a state callback is dropped
+_MAX_CALLBACK_FAILURES = 3
+
+# Client methods reachable through _execute
+_CLIENT_COMMANDS = (
+    "power_on",
+    "power_off",
+    "set_color",
+    "set_brightness",
+    "set_mode",
+    "configure_lightning",
+    "preview_lightning",
+    "set_name",
+)
+
+# Mode value to name, so formatting state needs no enum construction
+_MODE_NAMES: dict[int, str] = {m.value: m.name for m in Mode}
+
+
+def _mode_name(value: int) -> str:
+    """Name of a mode value, with manual mode (the usual state) checked first."""
+    if value == 0:
+        return "MANUAL"
+    return _MODE_NAMES.get(value, "UNKNOWN")
+
+
 class DeviceManager:
     """
     Singleton managing the BLE connection lifecycle.
@@ -32,10 +97,26 @@ class DeviceManager:
 
     def __init__(self):
         self._client: GamaltaClient | None = None
+        # Bound client methods by name, built once per connection
+        self._dispatch: dict[str, Callable[..., Awaitable]] = {}
+        # Uncontended acquire() of an asyncio.Lock completes without yielding
+        # to the event loop, so the common single-user path pays no extra hop
         self._lock = asyncio.Lock()
         self._scan_lock = asyncio.Lock()
-        self._state_callbacks: list[StateCallback] = []
+        # Callback -> consecutive failed deliveries
+        self._state_callbacks: dict[StateCallback, int] = {}
         self._polling_task: asyncio.Task | None = None
+        self._background_tasks: set[asyncio.Task] = set()
+        self._pending_writes: dict[str, Command] = {}
+        self._flush_future: asyncio.Future | None = None
+        self._pending_query: asyncio.Future | None = None
+        self._last_record: StateRecord | None = None
+        self._last_state: dict | None = None
+        self._last_state_ts = 0.0
+        self._idle_count = 0
+        self._poll_reset = asyncio.Event()
+        self._timestamp_second = -1
+        self._timestamp_iso = ""
         self._device_address: str | None = None
         self._device_name: str | None = None
 
@@ -61,18 +142,21 @@ class DeviceManager:
 
     def add_state_callback(self, callback: StateCallback) -> None:
         """Register a callback to receive state updates."""
-        if callback not in self._state_callbacks:
-            self._state_callbacks.append(callback)
+        self._state_callbacks.setdefault(callback, 0)
 
     def remove_state_callback(self, callback: StateCallback) -> None:
         """Unregister a state callback."""
-        if callback in self._state_callbacks:
-            self._state_callbacks.remove(callback)
+        self._state_callbacks.pop(callback, None)
 
     async def scan(self, timeout: float = 5.0) -> list[dict]:
         """
         Scan for Gamalta devices.
 
+        Discovery goes through the library's shared background scanner.
+        While no device is connected it is kept running, so consecutive
+        scans reuse one warmed-up scanner rather than creating a new one per
+        call; it is stopped once a device connects.
+
         Returns:
             List of dicts with 'address' and 'name' keys.
 
@@ -83,7 +167,11 @@ class DeviceManager:
             raise RuntimeError("Scan already in progress")
 
         async with self._scan_lock:
-            devices = await scan_for_devices(name_filter="Gamalta", timeout=timeout)
+            devices = await scan_for_devices(
+                name_filter="Gamalta",
+                timeout=timeout,
+                keep_scanning=not self.is_connected,
+            )
             return [{"address": d.address, "name": d.name or "Unknown"} for d in devices]
 
     async def connect(self, address: str | None = None) -> str:
@@ -110,11 +198,13 @@ class DeviceManager:
                     # Best-effort cleanup: ignore disconnect errors during reconnection.
                     pass
                 self._client = None
+                self._dispatch = {}
                 self._device_address = None
                 self._device_name = None
 
             self._client = GamaltaClient()
             await self._client.connect(address=address)
+            self._dispatch = {name: getattr(self._client, name) for name in _CLIENT_COMMANDS}
 
             # Determine and store resolved connection info
             resolved_address = address
@@ -128,12 +218,17 @@ class DeviceManager:
             self._device_address = resolved_address
             self._device_name = await self._client.query_name() or "Gamalta"
 
-            # Start polling for state changes
+            # Scanning is only useful for picking a device
+            await stop_scanner()
+
+            # Publish state frames as they arrive; polling remains as the
+            # fallback for changes the device does not report on its own
+            self._client.on_notify(self._on_notify)
             self._start_polling()
 
             # Broadcast connection state and initial device state
             await self._broadcast_connection(True)
-            await self._broadcast_state()
+            await self._broadcast_state(force=True)
 
             return self._device_name
 
@@ -148,9 +243,11 @@ class DeviceManager:
                     # Best-effort cleanup: ignore disconnect errors during shutdown.
                     pass
                 self._client = None
+                self._dispatch = {}
 
             self._device_address = None
             self._device_name = None
+            self._last_state = None
             await self._broadcast_connection(False)
 
     async def get_state(self) -> dict:
@@ -170,27 +267,55 @@ class DeviceManager:
                 "color": {"r": 0, "g": 0, "b": 0, "warm_white": 0, "cool_white": 0},
             }
 
-        async with self._lock:
-            try:
-                state = await self._client.query_state()
-                return self._format_state(state)
-            except Exception:
-                return {
-                    "connected": True,
-                    "power": False,
-                    "mode": 0,
-                    "mode_name": "MANUAL",
-                    "brightness": 0,
-                    "color": {"r": 0, "g": 0, "b": 0, "warm_white": 0, "cool_white": 0},
-                }
+        try:
+            if self._pending_query is not None:
+                # A query is already running; share its result
+                state = await self._query_state()
+            else:
+                async with self._lock:
+                    state = await self._query_state()
+            return self._remember_state(self._format_state(StateRecord.from_state(state)))
+        except Exception:
+            return {
+                "connected": True,
+                "power": False,
+                "mode": 0,
+                "mode_name": "MANUAL",
+                "brightness": 0,
+                "color": {"r": 0, "g": 0, "b": 0, "warm_white": 0, "cool_white": 0},
+            }
+
+    async def get_state_cached(self, max_age: float = 1.0) -> dict:
+        """
+        Get device state, reusing the last known state if it is recent.
+
+        Lets bursts of readers (e.g. several WebSocket clients connecting
+        at once) share one BLE query.
+
+        Args:
+            max_age: Maximum age in seconds of a cached state to return.
+        """
+        if (
+            self.is_connected
+            and self._last_state is not None
+            and time.monotonic() - self._last_state_ts < max_age
+        ):
+            return self._last_state
+        return await self.get_state()
+
+    def _remember_state(self, payload: dict) -> dict:
+        """Cache a formatted state for get_state_cached and return it."""
+        self._last_state = payload
+        self._last_state_ts = time.monotonic()
+        return payload
 
     async def power_on(self) -> None:
         """Turn the light on."""
-        await self._execute("power_on")
+        await self._execute("power_on", expect=lambda s: s["power"])
 
     async def power_off(self) -> None:
         """Turn the light off."""
-        await self._execute("power_off")
+        await self._execute("power_off", expect=lambda s: not s["power"])
 
     async def set_color(
         self, r: int, g: int, b: int, warm_white: int = 0, cool_white: int = 0
@@ -198,17 +323,27 @@ class DeviceManager:
         """Set the light color (RGBWC)."""
         # Pass set_manual_mode=False to avoid resetting colors when switching modes
         # The web UI handles mode selection separately
-        await self._execute("set_color", r, g, b, warm_white, cool_white, set_manual_mode=False)
+        target = Color(r, g, b, warm_white, cool_white)
+        await self._execute_batched(
+            "color",
+            Command(
+                "set_color", (r, g, b, warm_white, cool_white), {"set_manual_mode": False},
+                expect=lambda s: s["color"] == target,
+            ),
+        )
 
     async def set_brightness(self, percent: int) -> None:
         """Set brightness (0-100)."""
-        await self._execute("set_brightness", percent)
+        await self._execute_batched(
+            "brightness",
+            Command("set_brightness", (percent,), expect=lambda s: s["brightness"] == percent),
+        )
 
     async def set_mode(self, mode: Mode | int) -> None:
         """Set the operating mode."""
         if isinstance(mode, int):
             mode = Mode(mode)
-        await self._execute("set_mode", mode)
+        await self._execute("set_mode", mode, expect=lambda s: s["mode"] == mode)
 
     async def configure_lightning(self, config: LightningConfig) -> None:
         """Configure lightning effect schedule."""
@@ -223,30 +358,163 @@ class DeviceManager:
         await self._execute("set_name", name)
         self._device_name = name
 
-    async def _execute(self, method: str, *args, **kwargs):
+    async def _execute(
+        self,
+        method: str,
+        *args,
+        expect: Callable[[dict], bool] | None = None,
+        **kwargs,
+    ):
         """
         Execute a client method with proper locking.
 
         Args:
             method: Method name on GamaltaClient
             *args, **kwargs: Arguments to pass
+            expect: Predicate on the queried state that is true once the
+                device has applied the command
+        """
+        command = Command(method, args, kwargs, expect)
+        batch, future = self._take_batch()
+        if future is None:
+            results = await self._execute_commands([command])
+            return results[0]
+
+        # Batched commands were issued first, so they must reach the device
+        # first; send them now along with this one instead of after it
+        results = await self._run_batch(batch + [command], future)
+        return results[-1]
+
+    async def _execute_batched(self, key: str, command: Command) -> None:
+        """
+        Queue a command into a short batching window.
+
+        Within settings.batch_window only the latest command per key is kept,
+        and everything queued runs under one lock acquisition followed by a
+        single broadcast. An unbatched command issued in the meantime sends
+        the batch ahead of itself. Callers return once the batch has been
+        applied and see its errors.
+        """
+        self._pending_writes[key] = command
+        if self._flush_future is None:
+            self._flush_future = asyncio.get_running_loop().create_future()
+            self._spawn(self._flush_batch(self._flush_future))
+        await asyncio.shield(self._flush_future)
+
+    def _take_batch(self) -> tuple[list[Command], asyncio.Future | None]:
+        """Remove and return the queued batch and the future its callers await."""
+        batch = list(self._pending_writes.values())
+        future = self._flush_future
+        self._pending_writes = {}
+        self._flush_future = None
+        return batch, future
+
+    async def _flush_batch(self, future: asyncio.Future) -> None:
+        """Apply the commands collected by _execute_batched."""
+        await asyncio.sleep(settings.batch_window)
+        if self._flush_future is not future:
+            return  # Already sent ahead of an unbatched command
+
+        commands, _ = self._take_batch()
+        try:
+            await self._run_batch(commands, future)
+        except Exception:
+            pass  # Reported to the batched callers through the future
+
+    async def _run_batch(self, commands: list[Command], future: asyncio.Future) -> list:
+        """Execute a batch and resolve the future its callers are waiting on."""
+        try:
+            results = await self._execute_commands(commands)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        except BaseException:
+            future.set_exception(CommandError("Batched command cancelled"))
+            future.exception()
+            raise
+        future.set_result(None)
+        return results
+
+    async def _execute_commands(self, commands: list[Command]) -> list:
+        """
+        Execute client methods in order under one lock acquisition.
+
+        The resulting state is sampled until every command's expectation
+        holds, then broadcast once.
+
+        Returns:
+            The result of each command.
         """
         if not self.is_connected:
             raise NotConnectedError("Not connected to device")
 
+        expects = [c.expect for c in commands if c.expect is not None]
+        expect = (lambda s: all(e(s) for e in expects)) if expects else None
+
         async with self._lock:
-            func = getattr(self._client, method)
-            result = await func(*args, **kwargs)
+            results = []
+            for command in commands:
+                func = self._dispatch[command.method]
+                results.append(await func(*command.args, **command.kwargs))
+
+            # Wait for the device to reflect the commands
+            try:
+                state = await self._wait_for_change(expect, settings.settle_timeout)
+                broadcast = self._publish_state(state, force=True)
+            except Exception as e:
+                broadcast = self._broadcast_query_error(e)
+
+        # Fan out after releasing the lock so the next command can start
+        self._spawn(broadcast)
+
+        # The device is being used; poll at the base rate again
+        self._idle_count = 0
+        self._poll_reset.set()
 
-            # Small delay for device to process, then broadcast state
-            await asyncio.sleep(0.15)
-            await self._broadcast_state()
+        return results
 
-            return result
+    def _spawn(self, coro: Awaitable) -> None:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _wait_for_change(
+        self, expected: Callable[[dict], bool] | None, max_wait: float
+    ) -> dict:
+        """
+        Sample device state until it matches a predicate or max_wait passes.
+
+        Samples at geometrically growing delays (20, 40, 80, 160 ms, ...) so
+        a device that applies a command quickly is reported quickly, without
+        sleeping for a fixed worst-case delay. One sample is always taken;
+        another is only taken if it would also finish by the deadline,
+        assuming it queries as slowly as the last one.
+
+        Returns:
+            The last sampled state.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        delay = 0.02
+        while True:
+            await asyncio.sleep(delay)
+            started = loop.time()
+            state = await self._query_state()
+            if expected is None or expected(state):
+                return state
+            now = loop.time()
+            query_time = now - started
+            delay *= 2
+            if now + delay + query_time > deadline:
+                return state
 
     def _start_polling(self) -> None:
         """Start background polling for state changes."""
         self._stop_polling()
+        self._idle_count = 0
+        self._poll_reset.clear()
         self._polling_task = asyncio.create_task(self._poll_loop())
 
     def _stop_polling(self) -> None:
@@ -256,34 +524,120 @@ class DeviceManager:
             self._polling_task = None
 
     async def _poll_loop(self) -> None:
-        """Poll device state periodically."""
+        """
+        Poll device state periodically, backing off while nothing changes.
+
+        The interval doubles for each poll that sees no change (capped at
+        settings.poll_max_interval) and returns to settings.poll_interval
+        after a change or a command.
+        """
         while self.is_connected:
             try:
-                await asyncio.sleep(settings.poll_interval)
+                interval = min(
+                    settings.poll_max_interval,
+                    settings.poll_interval * 2 ** min(self._idle_count, 6),
+                )
+                try:
+                    await asyncio.wait_for(self._poll_reset.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+                else:
+                    # A command just broadcast fresh state; restart the wait
+                    self._poll_reset.clear()
+                    continue
+
                 if self.is_connected:
-                    await self._broadcast_state()
+                    changed = await self._broadcast_state()
+                    self._idle_count = 0 if changed else self._idle_count + 1
             except asyncio.CancelledError:
                 break
             except Exception:
                 continue
 
-    async def _broadcast_state(self) -> None:
-        """Query current state and broadcast to all subscribers."""
+    async def _broadcast_state(self, force: bool = False) -> bool:
+        """
+        Query current state and broadcast to all subscribers.
+
+        Unchanged state is not re-broadcast unless force is set.
+
+        Returns:
+            True if the state changed since it was last broadcast.
+        """
         if not self.is_connected or not self._client:
-            return
+            return False
+
+        try:
+            state = await self._query_state()
+        except Exception as e:
+            await self._broadcast_query_error(e)
+            return False
+        return await self._publish_state(state, force)
+
+    async def _publish_state(self, state: dict, force: bool = False) -> bool:
+        """
+        Broadcast an already-queried state to all subscribers.
+
+        Skipped when the state (ignoring its timestamp) matches the last one
+        broadcast, unless force is set.
+
+        Returns:
+            True if the state differs from the previously published one.
+        """
+        record = StateRecord.from_state(state)
+        changed = record != self._last_record
+        self._last_record = record
+        payload = self._remember_state(self._format_state(record))
+        if not changed and not force:
+            return False
+
+        await self._broadcast({
+            "type": "state",
+            "payload": payload,
+        })
+        return changed
+
+    async def _broadcast_query_error(self, error: Exception) -> None:
+        """Broadcast a failed state query to all subscribers."""
+        await self._broadcast({
+            "type": "error",
+            "payload": {"code": "query_failed", "message": str(error)},
+        })
+
+    def _on_notify(self, data: bytes | memoryview) -> None:
+        """Publish state frames received outside of our own queries."""
+        state = GamaltaClient.parse_state(data)
+        if state is not None:
+            self._spawn(self._publish_state(state))
+
+    async def _query_state(self) -> dict:
+        """
+        Query device state, sharing one BLE read between concurrent callers.
+
+        If a query is already in flight, wait for its result instead of
+        issuing another one.
+        """
+        if self._pending_query is not None:
+            return await asyncio.shield(self._pending_query)
 
+        future = asyncio.get_running_loop().create_future()
+        self._pending_query = future
         try:
             state = await self._client.query_state()
-            message = {
-                "type": "state",
-                "payload": self._format_state(state),
-            }
-            await self._broadcast(message)
         except Exception as e:
-            await self._broadcast({
-                "type": "error",
-                "payload": {"code": "query_failed", "message": str(e)},
-            })
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        except BaseException:
+            # Only the owner was cancelled; sharers get an ordinary error
+            # they already handle rather than a CancelledError of their own
+            future.set_exception(CommandError("State query cancelled"))
+            future.exception()
+            raise
+        else:
+            future.set_result(state)
+            return state
+        finally:
+            self._pending_query = None
 
     async def _broadcast_connection(self, connected: bool) -> None:
         """Broadcast connection state change."""
@@ -298,39 +652,54 @@ class DeviceManager:
         await self._broadcast(message)
 
     async def _broadcast(self, message: dict) -> None:
-        """Send message to all registered callbacks."""
-        for callback in self._state_callbacks:
-            try:
-                await callback(message)
-            except Exception:
-                # Best-effort broadcast: ignore callback errors to not block other subscribers.
-                pass
-
-    def _format_state(self, state: dict) -> dict:
-        """Format state dict for API response."""
-        mode_value = state.get("mode", 0)
-        try:
-            mode_name = Mode(mode_value).name
-        except ValueError:
-            mode_name = "UNKNOWN"
-
-        color = state.get("color", Color.off())
+        """Send message to all registered callbacks concurrently."""
+        # Best-effort broadcast: callback errors are returned, not raised,
+        # so one failing or slow subscriber doesn't hold up the others.
+        callbacks = list(self._state_callbacks)
+        results = await asyncio.gather(
+            *(callback(message) for callback in callbacks),
+            return_exceptions=True,
+        )
+
+        # Evict callbacks that keep failing; one success resets the count
+        for callback, result in zip(callbacks, results):
+            if callback not in self._state_callbacks:
+                continue
+            if isinstance(result, Exception):
+                failures = self._state_callbacks[callback] + 1
+                if failures >= _MAX_CALLBACK_FAILURES:
+                    del self._state_callbacks[callback]
+                else:
+                    self._state_callbacks[callback] = failures
+            else:
+                self._state_callbacks[callback] = 0
+
+    def _format_state(self, record: StateRecord) -> dict:
+        """Format a state record for API response."""
         return {
             "connected": True,
-            "power": state.get("power", False),
-            "mode": mode_value,
-            "mode_name": mode_name,
-            "brightness": state.get("brightness", 0),
+            "power": record.power,
+            "mode": record.mode,
+            "mode_name": _mode_name(record.mode),
+            "brightness": record.brightness,
             "color": {
-                "r": color.r,
-                "g": color.g,
-                "b": color.b,
-                "warm_white": color.warm_white,
-                "cool_white": color.cool_white,
+                "r": record.r,
+                "g": record.g,
+                "b": record.b,
+                "warm_white": record.warm_white,
+                "cool_white": record.cool_white,
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._timestamp(),
         }
 
+    def _timestamp(self) -> str:
+        """Current time as ISO 8601, reformatted at most once per second."""
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_iso = datetime.fromtimestamp(second).isoformat()
+        return self._timestamp_iso
+
 
 # Global singleton instance
 device_manager = DeviceManager()
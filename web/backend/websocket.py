@@ -1,88 +1,90 @@
 """WebSocket handler for real-time state updates."""
 
 import asyncio
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from .services.device_manager import device_manager
 
 
+def _send(websocket: WebSocket, message: dict):
+    """Send a message as a JSON text frame, encoded with orjson."""
+    return websocket.send_text(orjson.dumps(message).decode())
+
+
 class ConnectionManager:
     """Manages WebSocket connections and broadcasts."""
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
-        self._broadcast_queue: asyncio.Queue = asyncio.Queue()
-        self._broadcast_task: asyncio.Task | None = None
+        self.active_connections: set[WebSocket] = set()
+        # Connection payload most recently sent to each client
+        self._last_connection: dict[WebSocket, dict] = {}
         # Persist a single callback reference for proper add/remove deduplication
         self._state_callback = self._on_state_update
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
         # Register for state updates from device manager (uses persistent callback reference)
         device_manager.add_state_callback(self._state_callback)
 
-        # Start broadcast task if not running
-        if self._broadcast_task is None or self._broadcast_task.done():
-            self._broadcast_task = asyncio.create_task(self._broadcast_loop())
-
-        # Send initial state
-        state = await device_manager.get_state()
-        await websocket.send_json({
-            "type": "connection",
-            "payload": {
-                "connected": device_manager.is_connected,
-                "device_name": device_manager.device_name,
-                "device_address": device_manager.device_address,
-            },
-        })
+        # Send initial state (recent cached state is fine for a new client)
+        state = await device_manager.get_state_cached()
+        connection = {
+            "connected": device_manager.is_connected,
+            "device_name": device_manager.device_name,
+            "device_address": device_manager.device_address,
+        }
+        # A connection broadcast may already have reached this client while
+        # the state was being fetched
+        if self._last_connection.get(websocket) != connection:
+            self._last_connection[websocket] = connection
+            await _send(websocket, {
+                "type": "connection",
+                "payload": connection,
+            })
         if device_manager.is_connected:
-            await websocket.send_json({
+            await _send(websocket, {
                 "type": "state",
                 "payload": state,
             })
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Handle WebSocket disconnection."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._last_connection.pop(websocket, None)
 
         # Remove callback if no more connections
         if not self.active_connections:
             device_manager.remove_state_callback(self._state_callback)
-            if self._broadcast_task:
-                self._broadcast_task.cancel()
-                self._broadcast_task = None
 
     async def _on_state_update(self, message: dict) -> None:
         """Callback for device manager state updates."""
-        await self._broadcast_queue.put(message)
-
-    async def _broadcast_loop(self) -> None:
-        """Process broadcast queue and send to all clients."""
-        while True:
-            try:
-                message = await self._broadcast_queue.get()
-                await self._broadcast(message)
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                continue
+        # The device manager already fans out off its command lock, so send
+        # straight away rather than handing off through a queue
+        await self._broadcast(message)
 
     async def _broadcast(self, message: dict) -> None:
         """Send message to all connected clients."""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
+        # Encode once and share the text across every client. Text frames
+        # (not bytes) because the frontend JSON.parses event.data directly.
+        text = orjson.dumps(message).decode()
+        connections = list(self.active_connections)
+        if message.get("type") == "connection":
+            for connection in connections:
+                self._last_connection[connection] = message["payload"]
+        results = await asyncio.gather(
+            *(connection.send_text(text) for connection in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        for conn, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(conn)
 
     async def handle_message(self, websocket: WebSocket, data: dict) -> None:
         """Handle incoming WebSocket message."""
@@ -92,7 +94,7 @@ class ConnectionManager:
             # Request immediate state refresh
             if device_manager.is_connected:
                 state = await device_manager.get_state()
-                await websocket.send_json({
+                await _send(websocket, {
                     "type": "state",
                     "payload": state,
                 })